@@ -10,8 +10,15 @@ from .arxiv_client import (
     PaperNotFoundError,
     PDFCorruptError,
     SourceUnavailableError,
+    download_many_async,
+    download_many_threaded,
     download_pdf,
+    download_pdf_async,
+    download_pdf_batch,
     download_source,
+    download_source_async,
+    download_source_batch,
+    flush_metadata_logs,
 )
 from .source_extractor import (
     CorruptTarballError,
@@ -19,18 +26,27 @@ from .source_extractor import (
     MainTexNotFoundError,
     SourceManifest,
     extract_source,
+    extract_sources_batch,
 )
 
 __all__ = [
     # arxiv_client exports
     "download_source",
+    "download_source_batch",
+    "download_source_async",
     "download_pdf",
+    "download_pdf_batch",
+    "download_pdf_async",
+    "download_many_async",
+    "download_many_threaded",
+    "flush_metadata_logs",
     "PaperNotFoundError",
     "SourceUnavailableError",
     "PDFCorruptError",
     "NetworkError",
     # source_extractor exports
     "extract_source",
+    "extract_sources_batch",
     "SourceManifest",
     "MainTexNotFoundError",
     "CorruptTarballError",
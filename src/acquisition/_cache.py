@@ -0,0 +1,137 @@
+"""
+Persistent download cache for Astronomy RAG Corpus acquisition.
+
+Tracks successfully downloaded artifacts in a SQLite database so repeat
+pipeline runs skip work already done. The CSV metadata log records activity;
+this cache gates it — a hit means the artifact is on disk, validated, and
+fresh enough to trust without re-downloading.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Cache entries older than this are considered stale and re-downloaded.
+# 24h balances "skip re-downloads during iterative development" against
+# picking up replacement versions posted to arXiv.
+_TTL_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    arxiv_id TEXT NOT NULL,
+    artifact_type TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (arxiv_id, artifact_type)
+)
+"""
+
+
+def sha256_file(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file by streaming it in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DownloadCache:
+    """
+    SQLite-backed cache of downloaded arXiv artifacts.
+
+    Keyed on (arxiv_id, artifact_type). A lookup hit requires the recorded
+    file to still exist on disk with the recorded size and a fresh enough
+    timestamp — otherwise the entry is treated as a miss so callers fall
+    through to a normal download.
+
+    Thread-safe: a single connection guarded by a lock, so the threaded and
+    async bulk download paths can share one instance per output directory.
+    """
+
+    def __init__(self, output_dir: Path | str, ttl_seconds: float = _TTL_SECONDS):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = output_dir / "download_cache.db"
+        self.ttl_seconds = ttl_seconds
+
+        # AI NOTE: check_same_thread=False is safe here because every
+        # statement runs under self._lock. WAL mode lets concurrent processes
+        # read while one writes; synchronous=NORMAL is durable enough for a
+        # cache that can always be rebuilt by re-downloading.
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, arxiv_id: str, artifact_type: str) -> Path | None:
+        """
+        Return the cached artifact path for (arxiv_id, artifact_type), or None.
+
+        Verifies the file still exists with the recorded size and that the
+        entry hasn't exceeded the TTL. Stale or inconsistent entries are
+        treated as misses (the next successful download overwrites them).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, timestamp FROM downloads "
+                "WHERE arxiv_id = ? AND artifact_type = ?",
+                (arxiv_id, artifact_type),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        path, size, timestamp = row
+
+        if time.time() - timestamp > self.ttl_seconds:
+            logger.debug(f"Cache entry expired for {arxiv_id} ({artifact_type})")
+            return None
+
+        # Single stat() covers both the existence and size checks.
+        cached_path = Path(path)
+        try:
+            on_disk_size = cached_path.stat().st_size
+        except OSError:
+            on_disk_size = None
+        if on_disk_size != size:
+            logger.debug(f"Cache entry stale on disk for {arxiv_id} ({artifact_type})")
+            return None
+
+        logger.info(f"Cache hit for {arxiv_id} ({artifact_type}): {cached_path}")
+        return cached_path
+
+    def put(
+        self,
+        arxiv_id: str,
+        artifact_type: str,
+        path: Path,
+        size: int,
+        sha256: str,
+    ) -> None:
+        """Record a successfully downloaded and validated artifact."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO downloads "
+                "(arxiv_id, artifact_type, sha256, size, path, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (arxiv_id, artifact_type, sha256, size, str(path), time.time()),
+            )
+            self._conn.commit()
+        logger.debug(f"Cached {arxiv_id} ({artifact_type}): {path}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
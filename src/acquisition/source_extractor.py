@@ -7,13 +7,60 @@ and style files. Returns a manifest for downstream processing.
 """
 
 import logging
+import os
+import shutil
+import subprocess
 import tarfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+# AI NOTE: libarchive (via python-libarchive-c) drives native libarchive +
+# zlib in C with large read-ahead buffers, and is markedly faster than
+# pure-Python tarfile on decompress-heavy tarballs. It's optional — the
+# stdlib path below is the fallback when the binding isn't installed.
+try:
+    import libarchive
+except ImportError:
+    libarchive = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer sizes for the tarfile extraction path (see _extract_with_tarfile)
+_READ_BUFFER_SIZE = 1 << 20
+_COPY_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Conventional main-file names checked before the recursive .tex scan
+_MAIN_TEX_CANDIDATES = ("main.tex", "ms.tex", "paper.tex")
+
+# How much of each .tex file to inspect for \documentclass, and the marker
+# itself. The scan is a single C-level bytes search over this head slab —
+# no decode, no line iteration. 8 KiB covers even comment-heavy preambles.
+_TEX_HEAD_BYTES = 8192
+_DOCCLASS_MARKER = b"\\documentclass"
+
+# Extension-to-category dispatch table used by extract_source. Built once so
+# categorizing a member is a single dict lookup instead of an if-chain with
+# per-call set literals. Categorization by extension is a heuristic that works
+# for standard LaTeX projects; non-standard extensions land in 'other' and
+# remain accessible.
+_CATEGORY_BY_SUFFIX = {
+    ".tex": "auxiliary_tex",
+    ".bib": "bib",
+    # Figure formats common in arXiv submissions
+    ".png": "figure",
+    ".jpg": "figure",
+    ".jpeg": "figure",
+    ".pdf": "figure",
+    ".eps": "figure",
+    ".epsf": "figure",
+    ".ps": "figure",
+    # Style/class files
+    ".sty": "style",
+    ".cls": "style",
+}
+
 
 class ExtractionError(Exception):
     """Raised when tarball extraction fails."""
@@ -34,115 +81,419 @@ class CorruptTarballError(Exception):
 class SourceManifest:
     """
     Manifest of extracted LaTeX source files.
-    
+
     Provides categorized lists of files found in the extracted source tarball.
-    All paths are relative to the extraction directory root.
-    
+    All entries are relative-path strings rooted at the extraction directory.
+
+    AI NOTE: The file lists hold plain strings, not Path objects — Path
+    instances are heavyweight (parsed parts, flavour state), and a corpus
+    run keeps 10^5+ manifests with dozens of entries each resident. Use the
+    *_paths properties when actual Path objects are needed; open() accepts
+    the strings directly.
+
     Attributes:
         arxiv_id: arXiv paper identifier
-        main_tex: Path to primary .tex file (contains \\documentclass)
-        auxiliary_tex: List of other .tex files (chapters, appendices, includes)
-        bib_files: List of bibliography files (.bib)
-        figure_files: List of image files (.png, .jpg, .jpeg, .pdf, .eps, .epsf)
-        style_files: List of LaTeX style/class files (.sty, .cls)
-        other_files: List of all other files (README, Makefile, etc.)
+        main_tex: Relative path of primary .tex file (contains \\documentclass)
+        auxiliary_tex: Other .tex files (chapters, appendices, includes)
+        bib_files: Bibliography files (.bib)
+        figure_files: Image files (.png, .jpg, .jpeg, .pdf, .eps, .epsf)
+        style_files: LaTeX style/class files (.sty, .cls)
+        other_files: All other files (README, Makefile, etc.)
         extraction_dir: Root directory of extracted content
     """
     arxiv_id: str
-    main_tex: Path
-    auxiliary_tex: list[Path]
-    bib_files: list[Path]
-    figure_files: list[Path]
-    style_files: list[Path]
-    other_files: list[Path]
+    main_tex: str
+    auxiliary_tex: list[str]
+    bib_files: list[str]
+    figure_files: list[str]
+    style_files: list[str]
+    other_files: list[str]
     extraction_dir: Path
 
+    @property
+    def main_tex_path(self) -> Path:
+        """Absolute path to the main .tex file."""
+        return self.extraction_dir / self.main_tex
+
+    @property
+    def auxiliary_tex_paths(self) -> Iterator[Path]:
+        """Absolute paths to auxiliary .tex files, built lazily."""
+        return (self.extraction_dir / name for name in self.auxiliary_tex)
+
+    @property
+    def bib_paths(self) -> Iterator[Path]:
+        """Absolute paths to bibliography files, built lazily."""
+        return (self.extraction_dir / name for name in self.bib_files)
+
+    @property
+    def figure_paths(self) -> Iterator[Path]:
+        """Absolute paths to figure files, built lazily."""
+        return (self.extraction_dir / name for name in self.figure_files)
+
+    @property
+    def style_paths(self) -> Iterator[Path]:
+        """Absolute paths to style/class files, built lazily."""
+        return (self.extraction_dir / name for name in self.style_files)
+
+    @property
+    def other_paths(self) -> Iterator[Path]:
+        """Absolute paths to uncategorized files, built lazily."""
+        return (self.extraction_dir / name for name in self.other_files)
+
+
+def _has_documentclass(tex_file: Path) -> bool:
+    """
+    Check whether a .tex file declares \\documentclass near the top.
+
+    Reads the first 8 KiB as raw bytes — arXiv preambles always declare
+    \\documentclass within the first few KB, and a single binary read
+    avoids per-line UTF-8 decode overhead.
+    """
+    try:
+        with open(tex_file, "rb") as f:
+            head = f.read(_TEX_HEAD_BYTES)
+    except OSError as e:
+        logger.warning(f"Could not read {tex_file}: {e}")
+        return False
+    return _DOCCLASS_MARKER in head
+
+
+def _main_tex_from_heads(tex_heads: dict[str, bytes]) -> Optional[Path]:
+    """
+    Pick the main .tex file from heads captured during extraction.
+
+    Prefers conventional root-level names, then falls back to archive
+    order. Returns None when no captured head declares \\documentclass
+    (including when the backend captured nothing), letting the caller
+    fall back to the filesystem scan.
+
+    Args:
+        tex_heads: {archive name: first _TEX_HEAD_BYTES bytes} per .tex member
+
+    Returns:
+        Path to main .tex file (relative to extraction_dir), or None
+    """
+    for name in _MAIN_TEX_CANDIDATES:
+        head = tex_heads.get(name)
+        if head is not None and _DOCCLASS_MARKER in head:
+            logger.debug(f"Found main tex file: {name}")
+            return Path(name)
+
+    for name, head in tex_heads.items():
+        if _DOCCLASS_MARKER in head:
+            logger.debug(f"Found main tex file: {name}")
+            return Path(name)
+
+    return None
+
 
 def _find_main_tex(extraction_dir: Path) -> Path:
     """
     Identify the main .tex file by searching for \\documentclass.
-    
-    Scans all .tex files in extraction_dir (recursively) and returns the first
-    file that contains \\documentclass at the beginning. This is the standard
-    LaTeX convention for identifying the main document file.
-    
+
+    Checks conventional main-file names at the extraction root first
+    (main.tex, ms.tex, paper.tex, {arxiv_id}.tex), then falls back to
+    scanning all .tex files recursively. Returns the first file that
+    declares \\documentclass — the standard LaTeX convention for
+    identifying the main document file.
+
     Args:
         extraction_dir: Root directory of extracted source
-    
+
     Returns:
         Path to main .tex file (relative to extraction_dir)
-    
+
     Raises:
         MainTexNotFoundError: If no .tex file contains \\documentclass
     """
-    # AI NOTE: We search recursively because some arXiv tarballs have nested
-    # directory structures (e.g., main.tex in a subdirectory). The first match
-    # is returned — in ambiguous cases, this is usually the correct main file.
-    
-    for tex_file in extraction_dir.rglob("*.tex"):
-        try:
-            with open(tex_file, "r", encoding="utf-8", errors="ignore") as f:
-                # Read first 10 lines to find \\documentclass
-                for _ in range(10):
-                    line = f.readline()
-                    if not line:
-                        break
-                    if "\\documentclass" in line:
-                        # Return path relative to extraction_dir
-                        relative_path = tex_file.relative_to(extraction_dir)
-                        logger.debug(f"Found main tex file: {relative_path}")
-                        return relative_path
-        except OSError as e:
-            logger.warning(f"Could not read {tex_file}: {e}")
-            continue
-    
+    # AI NOTE: Most arXiv submissions use one of a handful of conventional
+    # main-file names, so checking those first usually avoids the recursive
+    # walk entirely. The os.walk fallback covers nested directory structures
+    # (e.g., main.tex in a subdirectory); first match wins in ambiguous
+    # cases. os.walk is scandir-based, so directories and files arrive
+    # already separated with no extra stat per entry — unlike rglob, which
+    # stats everything it yields.
+
+    for name in _MAIN_TEX_CANDIDATES + (f"{extraction_dir.name}.tex",):
+        candidate = extraction_dir / name
+        if candidate.is_file() and _has_documentclass(candidate):
+            logger.debug(f"Found main tex file: {name}")
+            return Path(name)
+
+    for dirpath, _dirnames, filenames in os.walk(extraction_dir):
+        for filename in filenames:
+            if not filename.endswith(".tex"):
+                continue
+            tex_file = Path(dirpath) / filename
+            if _has_documentclass(tex_file):
+                relative_path = tex_file.relative_to(extraction_dir)
+                logger.debug(f"Found main tex file: {relative_path}")
+                return relative_path
+
     # No main tex file found
     raise MainTexNotFoundError(
         f"No .tex file containing \\documentclass found in {extraction_dir}"
     )
 
 
-def _categorize_file(file_path: Path, main_tex: Path) -> Optional[str]:
+def _validate_member(
+    name: str,
+    linkname: Optional[str],
+    hardlink: bool = False,
+) -> None:
     """
-    Categorize a file by its extension and relation to main tex.
-    
-    Returns one of: 'auxiliary_tex', 'bib', 'figure', 'style', 'other'.
-    Returns None if file is the main tex file (already categorized separately).
-    
+    Reject an archive member that would write or link outside extraction_dir.
+
+    AI NOTE: Malicious tarballs can contain paths like "../../../etc/passwd"
+    or symlinks pointing outside. This is the validator for the libarchive
+    backend; the tarfile backend delegates to the stdlib data filter, which
+    enforces the same rules. Both checks here are pure string normalization —
+    nothing has been extracted yet, so resolve() would only stat/readlink
+    paths that don't exist while costing syscalls per member.
+
     Args:
-        file_path: Path to file (relative to extraction_dir)
-        main_tex: Path to main tex file (relative to extraction_dir)
-    
+        name: Member path as stored in the archive
+        linkname: Link target for symlink/hardlink members, else None
+        hardlink: True if the member is a hardlink rather than a symlink
+
+    Raises:
+        CorruptTarballError: If the member escapes the extraction directory
+    """
+    # Check path stays within extraction directory. The parts check catches
+    # every relative traversal ("..", "../x", "a/../../x" after normpath);
+    # a leading ".." alone must not be rejected, since names like
+    # "..weird.tex" are legitimate and stay inside.
+    norm = os.path.normpath(name)
+    if norm.startswith("/") or ".." in Path(norm).parts:
+        raise CorruptTarballError(
+            f"Tarball contains path escaping extraction dir: {name}"
+        )
+
+    # Check links don't point outside extraction directory. Symlink targets
+    # resolve relative to the link's own directory; hardlink targets are
+    # relative to the archive root (tarfile and libarchive both join them
+    # to the extraction dir directly). Either way, anything absolute or
+    # climbing past the extraction root is rejected.
+    if linkname:
+        if hardlink:
+            target = os.path.normpath(linkname)
+        else:
+            target = os.path.normpath(os.path.join(os.path.dirname(norm), linkname))
+        if target.startswith("/") or ".." in Path(target).parts:
+            raise CorruptTarballError(
+                f"Tarball contains link escaping extraction dir: "
+                f"{name} -> {linkname}"
+            )
+
+
+def _find_decompressor() -> Optional[str]:
+    """Locate an external gzip decompressor, preferring parallel pigz."""
+    for tool in ("pigz", "gzip"):
+        path = shutil.which(tool)
+        if path:
+            return path
+    return None
+
+
+def _extract_tar_members(
+    tar: tarfile.TarFile,
+    extraction_dir: Path,
+) -> tuple[list[str], dict[str, bytes]]:
+    """
+    Validate and extract tar members in a single sequential pass.
+
+    Works in both seekable and streaming ("r|") modes — each member is
+    validated immediately before it is written, so nothing escaping the
+    extraction directory ever touches disk. .tex members are written
+    manually so their heads can be captured for main-tex detection
+    without a second read from disk.
+
     Returns:
-        Category string or None if file is main tex
+        Tuple of (relative paths of extracted regular files,
+        {archive name: first _TEX_HEAD_BYTES} for .tex members)
     """
-    # AI NOTE: File categorization is based on extensions. This is a heuristic
-    # that works for standard LaTeX projects. Edge cases (e.g., non-standard
-    # extensions) will be categorized as 'other' and still accessible.
-    
-    if file_path == main_tex:
-        return None
-    
-    suffix = file_path.suffix.lower()
-    
-    # LaTeX files (excluding main)
-    if suffix == ".tex":
-        return "auxiliary_tex"
-    
-    # Bibliography files
-    if suffix == ".bib":
-        return "bib"
-    
-    # Figure files (common formats in arXiv submissions)
-    if suffix in {".png", ".jpg", ".jpeg", ".pdf", ".eps", ".epsf", ".ps"}:
-        return "figure"
-    
-    # Style/class files
-    if suffix in {".sty", ".cls"}:
-        return "style"
-    
-    # Everything else
-    return "other"
+    file_names = []
+    tex_heads: dict[str, bytes] = {}
+    member_count = 0
+
+    for member in tar:
+        member_count += 1
+        # AI NOTE: The stdlib "data" filter (PEP 706; 3.12, backported to
+        # 3.11.4+) does the path-traversal and link-escape validation here,
+        # maintained upstream. It doesn't only reject — it can also return a
+        # *renamed* member (e.g. absolute names have their leading slash
+        # stripped). All writes below must go through the returned member,
+        # or an absolute .tex name would escape the extraction dir via the
+        # manual tee path.
+        try:
+            member = tarfile.data_filter(member, str(extraction_dir))
+        except tarfile.FilterError as e:
+            raise CorruptTarballError(
+                f"Tarball contains unsafe member {member.name}: {e}"
+            )
+        # Collect names normalized — GNU tar commonly stores "./main.tex",
+        # which must compare equal to the normalized main-tex path during
+        # categorization or the main document gets double-counted.
+        name = os.path.normpath(member.name)
+        if member.isreg() and name.endswith(".tex"):
+            # Tee the head while the bytes are already in hand
+            source = tar.extractfile(member)
+            target = extraction_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            head = b""
+            with open(target, "wb", buffering=_READ_BUFFER_SIZE) as f:
+                while chunk := source.read(_COPY_BUFFER_SIZE):
+                    if len(head) < _TEX_HEAD_BYTES:
+                        head += chunk[:_TEX_HEAD_BYTES - len(head)]
+                    f.write(chunk)
+            tex_heads[name] = head
+            file_names.append(name)
+        else:
+            tar.extract(member, path=extraction_dir, filter="data")
+            if member.isreg():
+                file_names.append(name)
+
+    logger.debug(f"Extracted {member_count} members")
+    return file_names, tex_heads
+
+
+def _extract_with_tarfile(
+    tarball_path: Path,
+    extraction_dir: Path,
+) -> tuple[list[str], dict[str, bytes]]:
+    """
+    Extract a tarball with stdlib tarfile, streaming member by member.
+
+    Decompression is piped through an external pigz/gzip subprocess when
+    one is on PATH — pigz parallelizes gzip and both run outside the
+    interpreter — with tarfile consuming the pipe in streaming "r|" mode
+    so no seeks are issued. Falls back to in-process gzip ("r|gz") when
+    neither tool is installed. Fallback backend when libarchive isn't
+    available.
+
+    Returns:
+        Tuple of (relative paths of extracted regular files,
+        {archive name: head bytes} for .tex members)
+    """
+    # AI NOTE: tarfile copies member contents in 16 KiB chunks by default,
+    # which is ~64x more read/write syscalls than needed for multi-MB figure
+    # files. copybufsize raises that to 2 MiB; the 1 MiB pipe/read buffer
+    # feeds the tar reader larger chunks.
+    decompressor = _find_decompressor()
+    proc = None
+    if decompressor:
+        proc = subprocess.Popen(
+            [decompressor, "-dc", str(tarball_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=_READ_BUFFER_SIZE,
+        )
+        fileobj = proc.stdout
+        mode = "r|"
+    else:
+        fileobj = open(tarball_path, "rb", buffering=_READ_BUFFER_SIZE)
+        mode = "r|gz"
+
+    try:
+        with fileobj:
+            with tarfile.open(fileobj=fileobj, mode=mode) as tar:
+                tar.copybufsize = _COPY_BUFFER_SIZE
+                file_names, tex_heads = _extract_tar_members(tar, extraction_dir)
+    finally:
+        if proc is not None:
+            proc.wait()
+
+    if proc is not None and proc.returncode != 0:
+        raise CorruptTarballError(
+            f"Decompressor exited with status {proc.returncode}: {tarball_path}"
+        )
+
+    return file_names, tex_heads
+
+
+def _extract_with_libarchive(
+    tarball_path: Path,
+    extraction_dir: Path,
+) -> tuple[list[str], dict[str, bytes]]:
+    """
+    Extract a tarball with native libarchive, streaming entry blocks to disk.
+
+    Performs the same per-member security validation as the tarfile path,
+    then writes file contents through a 1 MiB buffer, teeing .tex heads
+    for main-tex detection as the blocks pass through. Directories are
+    created as needed; symlinks are materialized after validation; special
+    members (devices, fifos) are skipped.
+
+    Returns:
+        Tuple of (relative paths of extracted regular files,
+        {archive name: head bytes} for .tex members)
+
+    Raises:
+        CorruptTarballError: If the archive is invalid or contains escaping paths
+    """
+    file_names = []
+    tex_heads: dict[str, bytes] = {}
+    member_count = 0
+
+    try:
+        with libarchive.file_reader(str(tarball_path)) as archive:
+            for entry in archive:
+                member_count += 1
+                name = entry.pathname
+                linkname = entry.linkpath if (entry.issym or entry.islnk) else None
+                _validate_member(name, linkname, hardlink=bool(entry.islnk))
+
+                # Collect names normalized (e.g. strip GNU tar's "./" prefix)
+                # so they compare equal to the main-tex path later
+                name = os.path.normpath(name)
+                target = extraction_dir / name
+
+                if entry.isdir:
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                if entry.issym:
+                    target.symlink_to(entry.linkpath)
+                    continue
+
+                if entry.islnk:
+                    # Hardlink targets are archive-root-relative (validated
+                    # above); the linked-to member precedes its links in any
+                    # well-formed tar, so it already exists on disk. Matches
+                    # the tarfile backend, where the data filter recreates
+                    # hardlinks.
+                    try:
+                        os.link(extraction_dir / os.path.normpath(entry.linkpath), target)
+                    except OSError as e:
+                        raise CorruptTarballError(
+                            f"Cannot materialize hardlink {name} -> {entry.linkpath}: {e}"
+                        )
+                    continue
+
+                if not entry.isfile:
+                    # Devices, fifos, etc. have no place in a LaTeX tarball
+                    logger.warning(f"Skipping special archive member: {name}")
+                    continue
+
+                is_tex = name.endswith(".tex")
+                head = b""
+                with open(target, "wb", buffering=1 << 20) as f:
+                    for block in entry.get_blocks():
+                        if is_tex and len(head) < _TEX_HEAD_BYTES:
+                            head += bytes(block[:_TEX_HEAD_BYTES - len(head)])
+                        f.write(block)
+                if is_tex:
+                    tex_heads[name] = head
+
+                file_names.append(name)
+    except libarchive.exception.ArchiveError as e:
+        logger.error(f"Tarball extraction failed: {e}")
+        raise CorruptTarballError(f"Corrupt or invalid tarball: {e}")
+
+    logger.debug(f"Extracted {member_count} members")
+    return file_names, tex_heads
 
 
 def extract_source(
@@ -151,23 +502,24 @@ def extract_source(
 ) -> SourceManifest:
     """
     Extract arXiv source tarball and categorize files.
-    
+
     Extracts the tarball to {output_dir}/{arxiv_id}/, identifies the main
     .tex file, and categorizes all files into the manifest. Handles nested
-    directory structures within the tarball.
-    
+    directory structures within the tarball. Uses native libarchive when
+    installed, falling back to stdlib tarfile.
+
     Args:
         tarball_path: Path to .tar.gz source tarball
         output_dir: Parent directory where extracted content will be stored
-    
+
     Returns:
         SourceManifest with categorized file lists and extraction directory
-    
+
     Raises:
         CorruptTarballError: If tarball is corrupted or invalid
         MainTexNotFoundError: If main .tex file cannot be identified
         ExtractionError: If extraction fails for other reasons
-    
+
     Example:
         >>> manifest = extract_source("2411.00148.tar.gz", "./extracted")
         >>> print(f"Main tex: {manifest.main_tex}")
@@ -176,112 +528,78 @@ def extract_source(
     # AI NOTE: arXiv tarball naming is {arxiv_id}.tar.gz (no version suffix).
     # We extract this ID to create the output directory. The extraction
     # directory structure is {output_dir}/{arxiv_id}/.
-    
+
     tarball_path = Path(tarball_path)
     output_dir = Path(output_dir)
-    
+
     # Extract arXiv ID from tarball filename
     # Expected format: 2411.00148.tar.gz or 2411_00148.tar.gz
     arxiv_id = tarball_path.stem.replace(".tar", "").replace("_", "/")
-    
+
     extraction_dir = output_dir / arxiv_id
-    
+
     logger.info(f"Extracting source tarball: {tarball_path}")
     logger.info(f"Extraction directory: {extraction_dir}")
-    
+
     try:
         # Create extraction directory (will fail if already exists with content)
         extraction_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Extract tarball
+        # AI NOTE: Some arXiv tarballs extract into a subdirectory
+        # (e.g., 2411.00148/), others extract files directly.
+        # We extract everything and handle both cases in categorization.
         logger.debug(f"Opening tarball: {tarball_path}")
-        with tarfile.open(tarball_path, "r:gz") as tar:
-            # AI NOTE: Some arXiv tarballs extract into a subdirectory
-            # (e.g., 2411.00148/), others extract files directly.
-            # We extract everything and handle both cases in categorization.
-            
-            # Security validation before extracting
-            # AI NOTE: Malicious tarballs can contain paths like "../../../etc/passwd"
-            # or symlinks pointing outside. We validate all members before extraction.
-            extraction_dir_resolved = extraction_dir.resolve()
-            
-            for member in tar.getmembers():
-                # Resolve the full path this member would extract to
-                member_path = (extraction_dir / member.name).resolve()
-                
-                # Check path stays within extraction directory
-                try:
-                    member_path.relative_to(extraction_dir_resolved)
-                except ValueError:
-                    raise CorruptTarballError(
-                        f"Tarball contains path escaping extraction dir: {member.name}"
-                    )
-                
-                # Check symlinks don't point outside extraction directory
-                if member.issym() or member.islnk():
-                    link_target = Path(member.linkname)
-                    # Resolve relative to the directory containing the symlink
-                    symlink_dir = member_path.parent
-                    resolved_target = (symlink_dir / link_target).resolve()
-                    try:
-                        resolved_target.relative_to(extraction_dir_resolved)
-                    except ValueError:
-                        raise CorruptTarballError(
-                            f"Tarball contains link escaping extraction dir: "
-                            f"{member.name} -> {member.linkname}"
-                        )
-            
-            # Extract all members
-            tar.extractall(path=extraction_dir, filter="data")
-            logger.debug(f"Extracted {len(tar.getmembers())} members")
-        
+        if libarchive is not None:
+            file_names, tex_heads = _extract_with_libarchive(tarball_path, extraction_dir)
+        else:
+            file_names, tex_heads = _extract_with_tarfile(tarball_path, extraction_dir)
+
         logger.info(f"Extraction successful: {extraction_dir}")
-        
-        # Find main tex file
+
+        # Find main tex file — from heads captured during extraction, with
+        # the filesystem scan as fallback
         logger.debug("Searching for main .tex file...")
-        main_tex = _find_main_tex(extraction_dir)
+        main_tex = _main_tex_from_heads(tex_heads)
+        if main_tex is None:
+            main_tex = _find_main_tex(extraction_dir)
         logger.info(f"Main .tex file: {main_tex}")
-        
+
         # Categorize all files
         logger.debug("Categorizing extracted files...")
-        
-        auxiliary_tex: list[Path] = []
-        bib_files: list[Path] = []
-        figure_files: list[Path] = []
-        style_files: list[Path] = []
-        other_files: list[Path] = []
-        
-        # Walk through extraction directory recursively
-        for file_path in extraction_dir.rglob("*"):
-            # Skip directories
-            if not file_path.is_file():
-                continue
-            
-            # Get relative path
-            relative_path = file_path.relative_to(extraction_dir)
-            
-            # Categorize file
-            category = _categorize_file(relative_path, main_tex)
-            
-            if category == "auxiliary_tex":
-                auxiliary_tex.append(relative_path)
-            elif category == "bib":
-                bib_files.append(relative_path)
-            elif category == "figure":
-                figure_files.append(relative_path)
-            elif category == "style":
-                style_files.append(relative_path)
-            elif category == "other":
-                other_files.append(relative_path)
+
+        auxiliary_tex: list[str] = []
+        bib_files: list[str] = []
+        figure_files: list[str] = []
+        style_files: list[str] = []
+        other_files: list[str] = []
+
+        # Categorize straight off the archive member list — member names are
+        # already relative to the extraction directory.
+        # AI NOTE: Bound append methods and a pre-fetched dict .get keep this
+        # loop free of per-file function-call and attribute-lookup overhead;
+        # it runs once per member, hundreds of times for figure-heavy papers.
+        append_by_category = {
+            "auxiliary_tex": auxiliary_tex.append,
+            "bib": bib_files.append,
+            "figure": figure_files.append,
+            "style": style_files.append,
+            "other": other_files.append,
+        }
+        category_for_suffix = _CATEGORY_BY_SUFFIX.get
+
+        # One sort of the full member list keeps every per-category list in
+        # sorted order for free — five TimSort passes collapse into one.
+        file_names.sort()
+
+        main_tex_name = str(main_tex)
+        for name in file_names:
             # main_tex is not added to any list (handled separately)
-        
-        # Sort lists for consistent output
-        auxiliary_tex.sort()
-        bib_files.sort()
-        figure_files.sort()
-        style_files.sort()
-        other_files.sort()
-        
+            if name == main_tex_name:
+                continue
+            suffix = os.path.splitext(name)[1].lower()
+            append_by_category[category_for_suffix(suffix, "other")](name)
+
         # Log summary
         logger.info("Extraction summary:")
         logger.info(f"  Main .tex: {main_tex}")
@@ -290,11 +608,11 @@ def extract_source(
         logger.info(f"  Figure files: {len(figure_files)}")
         logger.info(f"  Style files: {len(style_files)}")
         logger.info(f"  Other files: {len(other_files)}")
-        
+
         # Create and return manifest
         manifest = SourceManifest(
             arxiv_id=arxiv_id,
-            main_tex=main_tex,
+            main_tex=main_tex_name,
             auxiliary_tex=auxiliary_tex,
             bib_files=bib_files,
             figure_files=figure_files,
@@ -302,25 +620,66 @@ def extract_source(
             other_files=other_files,
             extraction_dir=extraction_dir,
         )
-        
+
         return manifest
-    
+
     except tarfile.TarError as e:
         logger.error(f"Tarball extraction failed: {e}")
         raise CorruptTarballError(f"Corrupt or invalid tarball: {e}")
-    
+
     except MainTexNotFoundError:
         # Re-raise as-is (already has context)
         raise
-    
+
     except OSError as e:
         logger.error(f"File system error during extraction: {e}")
         raise ExtractionError(f"Extraction failed due to file system error: {e}")
-    
+
     except CorruptTarballError:
         # Re-raise as-is (specific error with context)
         raise
-    
+
     except Exception as e:
         logger.error(f"Unexpected error during extraction: {e}")
         raise ExtractionError(f"Unexpected error during extraction: {e}")
+
+
+def extract_sources_batch(
+    tarball_paths: list[Path | str],
+    output_dir: Path | str,
+    workers: Optional[int] = None,
+) -> tuple[dict[str, SourceManifest], dict[str, Exception]]:
+    """
+    Extract many source tarballs concurrently using a process pool.
+
+    Each tarball is independent — its own decompression, validation, and
+    output directory — so extraction parallelizes across cores. Processes
+    rather than threads: the gzip inflate and the Python member loop are
+    CPU-bound and would serialize under the GIL.
+
+    Args:
+        tarball_paths: Paths to .tar.gz source tarballs
+        output_dir: Parent directory for extracted content
+        workers: Worker process count (defaults to the CPU count)
+
+    Returns:
+        Tuple of (manifests by tarball path, exceptions by tarball path)
+    """
+    output_dir = Path(output_dir)
+
+    results: dict[str, SourceManifest] = {}
+    errors: dict[str, Exception] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(extract_source, tarball_path, output_dir): str(tarball_path)
+            for tarball_path in tarball_paths
+        }
+        for future in as_completed(futures):
+            tarball_path = futures[future]
+            try:
+                results[tarball_path] = future.result()
+            except Exception as e:
+                errors[tarball_path] = e
+
+    return results, errors
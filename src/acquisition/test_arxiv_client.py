@@ -30,6 +30,7 @@ from acquisition.arxiv_client import (
     SourceUnavailableError,
     download_pdf,
     download_source,
+    flush_metadata_logs,
 )
 from logging_config import setup_logging
 
@@ -79,16 +80,17 @@ def main():
         print(f"PDF file: {pdf_path}")
         print(f"File size: {pdf_path.stat().st_size} bytes\n")
         
-        # Check metadata CSV
-        metadata_path = output_dir / "download_metadata.csv"
+        # Check metadata database (rows are buffered; flush before reading)
+        flush_metadata_logs()
+        metadata_path = output_dir / "download_metadata.db"
         if metadata_path.exists():
             print(f"\n{'='*60}")
-            print("Metadata CSV Created")
+            print("Metadata Database Created")
             print(f"{'='*60}")
             print(f"Location: {metadata_path}")
             print(f"File size: {metadata_path.stat().st_size} bytes\n")
         else:
-            print(f"\nWARNING: Metadata CSV not found at {metadata_path}\n")
+            print(f"\nWARNING: Metadata database not found at {metadata_path}\n")
         
         return 0
         
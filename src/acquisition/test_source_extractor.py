@@ -136,7 +136,7 @@ def main():
             return 3
         
         # Verify main tex file exists
-        main_tex_path = manifest.extraction_dir / manifest.main_tex
+        main_tex_path = manifest.main_tex_path
         if not main_tex_path.exists():
             print(f"\n{'='*60}")
             print("ERROR: Main Tex File Not Found")
@@ -149,13 +149,15 @@ def main():
         print("SUCCESS: Extraction Completed")
         print(f"{'='*60}")
         print(f"Extraction directory: {manifest.extraction_dir}")
-        print(f"Total files extracted: {sum([
-            len(manifest.auxiliary_tex) + 1,  # +1 for main_tex
-            len(manifest.bib_files),
-            len(manifest.figure_files),
-            len(manifest.style_files),
-            len(manifest.other_files)
-        ])}\n")
+        total_files = (
+            1  # main_tex
+            + len(manifest.auxiliary_tex)
+            + len(manifest.bib_files)
+            + len(manifest.figure_files)
+            + len(manifest.style_files)
+            + len(manifest.other_files)
+        )
+        print(f"Total files extracted: {total_files}\n")
         
         return 0
         
@@ -5,9 +5,35 @@ Provides consistent logging format across all modules. Call setup_logging()
 once at application entry point, then use logging.getLogger(__name__) in modules.
 """
 
+import functools
 import logging
 import sys
 
+# Level the root logger was last configured at by setup_logging, or None if
+# setup_logging has not run yet. Lets repeat calls at the same level return
+# without rebuilding handlers.
+_CONFIGURED_LEVEL: int | None = None
+
+# Format: timestamp | level (padded) | module path | message
+# The module path uses %(name)s which reflects the logger name from
+# getLogger(__name__), giving us the full dotted module path. Built once at
+# module scope — Formatter construction parses the date format, and the same
+# instance can back every handler setup_logging creates.
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_level(level: str) -> int:
+    """Map a level name to its numeric value, falling back to INFO."""
+    log_level = getattr(logging, level.upper(), None)
+    if log_level is None or not isinstance(log_level, int):
+        # Invalid level string (e.g., "VERBOSE") - fall back to INFO
+        log_level = logging.INFO
+    return log_level
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
@@ -19,20 +45,23 @@ def setup_logging(level: str = "INFO") -> None:
     This function should be called once at application entry point.
     Modules should then use logging.getLogger(__name__) to get loggers.
     """
-    # AI NOTE: Call once at entry point only. Multiple calls are safe (handlers
-    # are cleared below) but wasteful. If logging seems broken, check that this
-    # was called before any getLogger() usage.
-    
+    # AI NOTE: Call once at entry point only. Repeat calls at the same level
+    # return immediately via the _CONFIGURED_LEVEL guard; calls at a new
+    # level reconfigure. If logging seems broken, check that this was called
+    # before any getLogger() usage.
+    global _CONFIGURED_LEVEL
+
     # Defensive handling: ensure level is a valid string before processing.
     # Protects against None being passed explicitly or invalid level names.
     if not level or not isinstance(level, str):
         level = "INFO"
-    
-    log_level = getattr(logging, level.upper(), None)
-    if log_level is None:
-        # Invalid level string (e.g., "VERBOSE") - fall back to INFO
-        log_level = logging.INFO
-    
+
+    log_level = _parse_level(level)
+
+    # Already configured at this level — skip rebuilding handlers/formatter
+    if _CONFIGURED_LEVEL == log_level:
+        return
+
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
@@ -43,13 +72,7 @@ def setup_logging(level: str = "INFO") -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     
-    # Format: timestamp | level (padded) | module path | message
-    # The module path uses %(name)s which reflects the logger name from
-    # getLogger(__name__), giving us the full dotted module path.
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-    
+    console_handler.setFormatter(_FORMATTER)
+
+    _CONFIGURED_LEVEL = log_level
     root_logger.addHandler(console_handler)